@@ -4,62 +4,66 @@
 
 Provides:
     def stream_users() -> generator that yields one user record at a time (as dict)
+    def stream_users_filtered(min_age) -> same, restricted to users with age > min_age
 """
 
-import os
-import mysql.connector
 from mysql.connector import Error
 from typing import Iterator, Dict
 
-# DB config via environment variables (defaults kept for local dev)
-MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
-MYSQL_USER = os.getenv("MYSQL_USER", "root")
-MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")  # set via env var
-MYSQL_PORT = int(os.getenv("MYSQL_PORT", "3306"))
-DB_NAME = "ALX_prodev"
-TABLE_NAME = "user_data"
+import seed
+
+# DB config (host, credentials, pool size) lives in seed.py and is read from env vars
+TABLE_NAME = seed.TABLE_NAME
+# rows pulled from the server per round trip (keeps memory bounded to one batch)
+FETCH_SIZE = seed.FETCH_SIZE
+
+# formatted once here, not on every stream_users_filtered() call
+_SQL_SELECT_USERS_OVER_AGE = f"SELECT user_id, name, email, age FROM `{TABLE_NAME}` WHERE age > %s;"
 
 
 def _connect_to_prodev():
-    """Return a connection to the ALX_prodev database (or raise)."""
-    return mysql.connector.connect(
-        host=MYSQL_HOST,
-        user=MYSQL_USER,
-        password=MYSQL_PASSWORD,
-        port=MYSQL_PORT,
-        database=DB_NAME,
-    )
+    """Return a (pooled when possible) connection to the ALX_prodev database (or raise)."""
+    return seed.get_prodev_connection()
 
 
-def stream_users() -> Iterator[Dict]:
+def _stream_query(sql: str, params: tuple = ()) -> Iterator[Dict]:
     """
-    Generator that yields rows from user_data one by one as dictionaries:
-      {'user_id': ..., 'name': ..., 'email': ..., 'age': ...}
+    Run `sql` and yield its rows one by one as dictionaries.
 
-    IMPORTANT: keep the generator running while iterating to keep the DB connection open.
-    Only one loop is used below (for row in cursor).
+    Uses an unbuffered (server-side) cursor so the result set is never held in
+    memory all at once; rows are pulled in chunks of FETCH_SIZE. If the caller
+    closes the generator early, the query is aborted server-side instead of
+    draining the unread rows.
     """
     conn = None
     cursor = None
+    streaming = False  # True while the query may still have unread rows
     try:
         conn = _connect_to_prodev()
-        # Use dictionary=True so each cursor row is already a dict (no extra loop)
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(f"SELECT user_id, name, email, age FROM `{TABLE_NAME}`;")
-        # single loop that yields rows one-by-one
-        for row in cursor:
-            # Optionally normalize types (age to int)
-            try:
-                row["age"] = int(row["age"])
-            except Exception:
-                # if conversion fails, leave as-is
-                pass
-            yield row
+        # plain tuple cursor; buffered=False streams from the server
+        cursor = conn.cursor(buffered=False)
+        cursor.arraysize = FETCH_SIZE
+        cursor.execute(sql, params)
+        streaming = True
+        columns = cursor.column_names  # resolved once, not per row
+        # single loop: one round trip per chunk, rows yielded one-by-one
+        while True:
+            rows = cursor.fetchmany(cursor.arraysize)
+            if not rows:
+                streaming = False
+                break
+            # age is an INT column, so the driver already returns int values
+            yield from (dict(zip(columns, row)) for row in rows)
     except Error as e:
         # If desired, raise or print; raising will propagate to caller
         raise
     finally:
         # Clean up resources when generator is exhausted or closed
+        try:
+            if streaming:
+                seed.abort_query(conn)
+        except Exception:
+            pass
         try:
             if cursor:
                 cursor.close()
@@ -70,3 +74,21 @@ def stream_users() -> Iterator[Dict]:
                 conn.close()
         except Exception:
             pass
+
+
+def stream_users() -> Iterator[Dict]:
+    """
+    Generator that yields rows from user_data one by one as dictionaries:
+      {'user_id': ..., 'name': ..., 'email': ..., 'age': ...}
+
+    IMPORTANT: keep the generator running while iterating to keep the DB connection open.
+    """
+    yield from _stream_query(seed.SQL_SELECT_USERS)
+
+
+def stream_users_filtered(min_age: int) -> Iterator[Dict]:
+    """
+    Like stream_users(), but only yields users with age > min_age.
+    The filter runs in MySQL, so rows that do not qualify never leave the server.
+    """
+    yield from _stream_query(_SQL_SELECT_USERS_OVER_AGE, (min_age,))
@@ -3,54 +3,56 @@
 1-batch_processing.py
 
 Provides:
-- stream_users_in_batches(batch_size): yields lists (batches) of user dicts
+- stream_users_in_batches(batch_size, min_age=None): yields lists (batches) of user dicts
 - batch_processing(batch_size): processes each batch to filter users over age 25
   and prints each filtered user (one per line, with a blank line after each).
 
 Constraints respected:
 - Uses yield generator
-- No more than 3 loops in total (1 loop in stream_users_in_batches, 2 loops in batch_processing)
+- No more than 3 loops in total (1 loop in stream_users_in_batches, 1 loop in batch_processing)
 """
 
-from typing import List, Dict, Iterator
+import sys
+from itertools import islice
+from typing import List, Dict, Iterator, Optional
 
 # import the stream_users generator from 0-stream_users.py
 _stream_mod = __import__("0-stream_users")
 stream_users = _stream_mod.stream_users
+stream_users_filtered = _stream_mod.stream_users_filtered
 
 
-def stream_users_in_batches(batch_size: int) -> Iterator[List[Dict]]:
+def stream_users_in_batches(batch_size: int, min_age: Optional[int] = None) -> Iterator[List[Dict]]:
     """
     Generator that yields batches (lists) of users of size up to batch_size.
-    Uses a single loop to pull users from stream_users().
+    Uses a single loop to pull users from stream_users(), or from
+    stream_users_filtered(min_age) when min_age is given; each batch is
+    sliced off the stream in one islice() call rather than row by row.
     """
     if batch_size <= 0:
         raise ValueError("batch_size must be > 0")
 
-    batch: List[Dict] = []
-    for user in stream_users():  # single loop
-        batch.append(user)
-        if len(batch) >= batch_size:
-            yield batch
-            batch = []
-    if batch:
+    users = stream_users() if min_age is None else stream_users_filtered(min_age)
+    while True:  # single loop (one iteration per batch)
+        batch: List[Dict] = list(islice(users, batch_size))
+        if not batch:
+            break
         yield batch
 
 
 def batch_processing(batch_size: int) -> None:
     """
     Processes batches produced by stream_users_in_batches:
-    - filters users with age > 25
+    - filters users with age > 25 (the filter is applied in SQL)
     - prints each filtered user (one per line) followed by a blank line
 
-    Uses at most 2 loops here:
+    Output for a whole batch is joined and written with one
+    sys.stdout.write() call rather than two print() calls per user.
+
+    Uses 1 loop here:
       1) iterate over batches
-      2) iterate over filtered users within each batch (prints them)
     """
-    for batch in stream_users_in_batches(batch_size):  # loop 1 (across batches)
-        # filter users over age 25 (comprehension does not count as an extra explicit loop here)
-        filtered = [u for u in batch if (isinstance(u.get("age"), int) and u.get("age") > 25) or
-                    (not isinstance(u.get("age"), int) and int(float(u.get("age"))) > 25)]
-        for user in filtered:  # loop 2 (across filtered users)
-            print(user)
-            print()
+    for batch in stream_users_in_batches(batch_size, min_age=25):  # loop 1 (across batches)
+        # map(str) + join keep the per-user formatting loop in C
+        sys.stdout.write("\n\n".join(map(str, batch)) + "\n\n")
+    sys.stdout.flush()
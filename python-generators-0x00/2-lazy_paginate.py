@@ -8,24 +8,114 @@ using a generator.
 
 Functions:
 - paginate_users(page_size, offset)
+- paginate_users_after(page_size, last_user_id, cursor)
 - lazy_pagination(page_size)
 """
 
+import queue
+import threading
+
 import seed
 
+# pages queued ahead of the consumer; at most PREFETCH_PAGES + 2 pages are
+# alive at once (the caller's page, the queued ones, and one the producer
+# holds while waiting for queue space)
+PREFETCH_PAGES = 2
+_DONE = object()  # end-of-pages marker put on the prefetch queue
+
+_SQL_PAGE_OFFSET = "SELECT * FROM user_data LIMIT %s OFFSET %s"
+_SQL_PAGE_AFTER = (
+    "SELECT user_id, name, email, age FROM user_data "
+    "WHERE user_id > %s ORDER BY user_id LIMIT %s"
+)
+
 
-def paginate_users(page_size, offset):
+def _fetch_page(cursor):
+    """
+    Fetch all rows of the last query on a plain (tuple) cursor and return
+    them as dicts, resolving the column names once per page.
+    """
+    columns = cursor.column_names
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def paginate_users(page_size, offset, cursor=None):
     """
     Fetch a single page of users from the user_data table.
     Returns a list of rows (dicts).
+
+    If `cursor` (a plain, non-dictionary cursor) is given it is reused
+    (no connect/close per page); otherwise a pooled connection is opened
+    just for this page.
     """
+    if cursor is not None:
+        cursor.execute(_SQL_PAGE_OFFSET, (page_size, offset))
+        return _fetch_page(cursor)
+
     connection = seed.connect_to_prodev()
-    cursor = connection.cursor(dictionary=True)
-    cursor.execute(f"SELECT * FROM user_data LIMIT {page_size} OFFSET {offset}")
-    rows = cursor.fetchall()
-    cursor.close()
-    connection.close()
-    return rows
+    cursor = connection.cursor()
+    try:
+        cursor.execute(_SQL_PAGE_OFFSET, (page_size, offset))
+        return _fetch_page(cursor)
+    finally:
+        cursor.close()
+        connection.close()
+
+
+def paginate_users_after(page_size, last_user_id, cursor):
+    """
+    Fetch the page of users whose user_id sorts after `last_user_id`
+    (keyset / seek pagination). Each call is an index range scan of
+    at most `page_size` rows, unlike OFFSET which rescans skipped rows.
+    `cursor` must be a plain (non-dictionary) cursor; a prepared one
+    (cursor(prepared=True)) reuses the parsed statement across pages.
+    Returns a list of rows (dicts).
+    """
+    cursor.execute(_SQL_PAGE_AFTER, (last_user_id, page_size))
+    return _fetch_page(cursor)
+
+
+def _put(pages, item, stop):
+    """Put `item` on the `pages` queue, giving up once `stop` is set."""
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _prefetch_pages(page_size, pages, stop):
+    """
+    Producer thread body: walk user_data with keyset pagination on its own
+    pooled connection and put each page on `pages`, then _DONE.
+    Errors are put on the queue so the consumer re-raises them.
+    """
+    connection = None
+    try:
+        connection = seed.connect_to_prodev()
+        if connection is None:
+            raise ConnectionError(f"could not connect to {seed.DB_NAME}")
+        # prepared: the page query is parsed once and re-executed per page
+        cursor = connection.cursor(prepared=True)
+        try:
+            last_user_id = ""
+            while not stop.is_set():
+                page = paginate_users_after(page_size, last_user_id, cursor)
+                if not page:
+                    break  # stop when no more records
+                _put(pages, page, stop)
+                if len(page) < page_size:
+                    break  # short page: nothing left after it
+                last_user_id = page[-1]["user_id"]
+        finally:
+            cursor.close()
+    except Exception as e:
+        _put(pages, e, stop)
+    finally:
+        if connection is not None:
+            connection.close()
+        _put(pages, _DONE, stop)
 
 
 def lazy_pagination(page_size):
@@ -33,13 +123,28 @@ def lazy_pagination(page_size):
     Generator that lazily fetches pages of users one by one
     using only ONE loop.
 
+    Pages are walked in user_id order using keyset pagination by a
+    background thread that queues up to PREFETCH_PAGES pages ahead, so
+    the next page is usually ready while the caller handles the current
+    one (at most PREFETCH_PAGES + 2 pages are held in memory). The
+    thread holds one connection for the generator lifetime and is
+    stopped once the generator is exhausted or closed.
+
     Yields:
         A list of user rows (each page) from user_data.
     """
-    offset = 0
-    while True:  # single loop
-        page = paginate_users(page_size, offset)
-        if not page:
-            break  # stop when no more records
-        yield page
-        offset += page_size
+    pages = queue.Queue(maxsize=PREFETCH_PAGES)
+    stop = threading.Event()
+    worker = threading.Thread(target=_prefetch_pages, args=(page_size, pages, stop), daemon=True)
+    worker.start()
+    try:
+        while True:  # single loop
+            page = pages.get()
+            if page is _DONE:
+                break  # stop when no more records
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        stop.set()
+        worker.join()
@@ -7,43 +7,65 @@ Use a generator to compute a memory-efficient average age for a large dataset.
 
 Functions:
 - stream_user_ages(): yields ages one by one from the database
-- compute_average_age(): calculates average age using the generator
+- compute_average_age(): calculates average age with a single SQL aggregate
 """
 
+from operator import itemgetter
+
 import seed
 
+# ages pulled from the server per round trip
+FETCH_SIZE = seed.FETCH_SIZE
+
 
 def stream_user_ages():
     """
     Generator that yields user ages one by one from the database.
+
+    Ages are streamed through an unbuffered cursor in chunks of FETCH_SIZE
+    and unpacked with map(itemgetter(0), ...) rather than per-row tuple
+    unpacking in Python. The cursor and connection are released even if
+    the caller stops early; the query is then aborted server-side
+    (seed.abort_query) instead of draining the unread ages.
     """
     connection = seed.connect_to_prodev()
-    cursor = connection.cursor()
-    cursor.execute("SELECT age FROM user_data")
-
-    for (age,) in cursor:  # loop 1
-        yield int(age)
-
-    cursor.close()
-    connection.close()
+    cursor = connection.cursor(buffered=False)
+    streaming = False  # True while the query may still have unread rows
+    try:
+        cursor.execute("SELECT age FROM user_data")
+        streaming = True
+        while True:  # loop 1
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                streaming = False
+                break
+            yield from map(itemgetter(0), rows)  # INT column: already ints
+    finally:
+        if streaming:
+            seed.abort_query(connection)
+        cursor.close()
+        connection.close()
 
 
 def compute_average_age():
     """
-    Computes the average age using the stream_user_ages generator,
-    without loading the full dataset into memory.
-    """
-    total_age = 0
-    count = 0
+    Computes the average age of all users.
 
-    for age in stream_user_ages():  # loop 2
-        total_age += age
-        count += 1
+    The aggregate runs in MySQL (AVG/COUNT), so only one row comes back
+    instead of streaming every age through stream_user_ages().
+    """
+    connection = seed.connect_to_prodev()
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT AVG(age), COUNT(*) FROM user_data")
+        avg_age, count = cursor.fetchone()
+    finally:
+        cursor.close()
+        connection.close()
 
     if count == 0:
         print("No user data found.")
     else:
-        avg_age = total_age / count
         print(f"Average age of users: {avg_age:.2f}")
 
 
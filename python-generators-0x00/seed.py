@@ -8,9 +8,9 @@ and provides a generator to stream rows one-by-one.
 Prototypes implemented:
 - connect_db()
 - create_database(connection)
-- connect_to_prodev()
+- connect_to_prodev()   (pooled; see get_pool())
 - create_table(connection)
-- insert_data(connection, data)
+- insert_data(connection, data)   (LOAD DATA LOCAL INFILE, with a Python fallback)
 - stream_user_data(connection)
 
 """
@@ -18,9 +18,15 @@ Prototypes implemented:
 import os
 import csv
 import uuid
-from typing import Iterator, Optional, Tuple
+import threading
+import warnings
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, Union
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from mysql.connector.abstracts import MySQLConnectionAbstract
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
 
 # --- Configuration (use env vars; sensible defaults) ---
 MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
@@ -30,9 +36,51 @@ MYSQL_PORT = int(os.getenv("MYSQL_PORT", "3306"))
 DB_NAME = "ALX_prodev"
 TABLE_NAME = "user_data"
 DEFAULT_CSV = "user_data.csv"  # local CSV file in your repo root
+INSERT_BATCH_SIZE = 1000  # rows sent per INSERT round trip
+# rows pulled from the server per round trip by the streaming generators
+FETCH_SIZE = int(os.getenv("STREAM_FETCH_SIZE", "1000"))
+# Seed with LOAD DATA LOCAL INFILE (needs server local_infile=ON); set to 0 to force row inserts
+USE_LOAD_DATA = os.getenv("SEED_USE_LOAD_DATA", "1") == "1"
+POOL_NAME = "prodev"
+POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "8"))
+
+# use_pure=False below only *prefers* the C extension; without it mysql-connector
+# silently falls back to the pure-Python driver, which decodes every row in Python.
+if not mysql.connector.HAVE_CEXT:
+    warnings.warn(
+        "mysql-connector C extension is not available; using the slower pure-Python driver",
+        RuntimeWarning,
+    )
+
+# Annotations use the driver-neutral base class, so this module still imports
+# (and the warning above is seen) when only the pure-Python driver is present.
+ProdevConnection = Union[PooledMySQLConnection, MySQLConnectionAbstract]
+
+# Shared pool for ALX_prodev connections; created lazily because the database
+# may not exist yet when this module is imported (see __main__ below).
+_POOL: Optional[MySQLConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+# SQL built once at import time rather than formatted on every call
+# (SQL_SELECT_USERS is shared with 0-stream_users.py)
+SQL_SELECT_USERS = f"SELECT user_id, name, email, age FROM `{TABLE_NAME}`;"
+_SQL_INSERT_USERS_PREFIX = f"INSERT IGNORE INTO `{TABLE_NAME}` (user_id, name, email, age) VALUES "
+_SQL_LOAD_DATA = f"""
+    LOAD DATA LOCAL INFILE %s
+    IGNORE INTO TABLE `{TABLE_NAME}`
+    CHARACTER SET utf8mb4
+    FIELDS TERMINATED BY ','
+    IGNORE 1 LINES
+    (@name, @email, @age)
+    SET user_id = UUID(),
+        name = TRIM(BOTH '"' FROM TRIM(@name)),
+        email = TRIM(BOTH '"' FROM TRIM(@email)),
+        age = TRIM(BOTH '"' FROM TRIM(@age));
+    """
+_SQL_DELETE_NO_EMAIL = f"DELETE FROM `{TABLE_NAME}` WHERE email = '';"
 
 
-def connect_db() -> Optional[mysql.connector.connection_cext.CMySQLConnection]:
+def connect_db() -> Optional[MySQLConnectionAbstract]:
     """
     Connect to MySQL server
     """
@@ -43,6 +91,7 @@ def connect_db() -> Optional[mysql.connector.connection_cext.CMySQLConnection]:
             password=MYSQL_PASSWORD,
             port=MYSQL_PORT,
             autocommit=False,
+            use_pure=False,
         )
         return conn
     except Error as e:
@@ -50,7 +99,7 @@ def connect_db() -> Optional[mysql.connector.connection_cext.CMySQLConnection]:
         return None
 
 
-def create_database(connection: mysql.connector.connection_cext.CMySQLConnection) -> None:
+def create_database(connection: MySQLConnectionAbstract) -> None:
     """
     Create the ALX_prodev database if it does not exist.
     """
@@ -68,26 +117,86 @@ def create_database(connection: mysql.connector.connection_cext.CMySQLConnection
             cursor.close()
 
 
-def connect_to_prodev() -> Optional[mysql.connector.connection_cext.CMySQLConnection]:
+def _prodev_config() -> dict:
+    """Connection settings shared by the pool and its overflow connections."""
+    return dict(
+        host=MYSQL_HOST,
+        user=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        port=MYSQL_PORT,
+        database=DB_NAME,
+        autocommit=False,
+        use_pure=False,  # C extension when installed (see HAVE_CEXT check above)
+        # read away any unread result on cursor close/pool return
+        # instead of raising "Unread result found"
+        consume_results=True,
+    )
+
+
+def get_pool() -> MySQLConnectionPool:
+    """
+    Return the shared ALX_prodev connection pool, creating it on first use.
+    Raises mysql.connector.Error if the pool cannot be created.
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = MySQLConnectionPool(pool_name=POOL_NAME, pool_size=POOL_SIZE, **_prodev_config())
+    return _POOL
+
+
+def get_prodev_connection() -> ProdevConnection:
     """
-    Connect to the ALX_prodev database and return the connection (or None).
+    Return a connection to the ALX_prodev database (or raise mysql.connector.Error).
+
+    Connections come from the shared pool. MySQLConnectionPool does not wait
+    for a free slot, so when all POOL_SIZE connections are in use (open
+    streams, prefetch threads, ...) a plain, unpooled connection is opened
+    instead. Calling .close() returns a pooled connection to the pool and
+    really closes an overflow one.
     """
     try:
-        conn = mysql.connector.connect(
-            host=MYSQL_HOST,
-            user=MYSQL_USER,
-            password=MYSQL_PASSWORD,
-            port=MYSQL_PORT,
-            database=DB_NAME,
-            autocommit=False,
-        )
-        return conn
+        return get_pool().get_connection()
+    except PoolError:
+        return mysql.connector.connect(**_prodev_config())
+
+
+def connect_to_prodev() -> Optional[ProdevConnection]:
+    """
+    Get a connection to the ALX_prodev database (or None); see get_prodev_connection().
+    """
+    try:
+        return get_prodev_connection()
     except Error as e:
         print(f"[connect_to_prodev] Error connecting to DB `{DB_NAME}`: {e}")
         return None
 
 
-def create_table(connection: mysql.connector.connection_cext.CMySQLConnection) -> None:
+def abort_query(conn) -> None:
+    """
+    Ask the server to stop the query still streaming on `conn` (KILL QUERY,
+    sent over a second connection), so closing the cursor does not
+    have to read and discard the rest of the result set.
+    Best effort: any failure just falls back to draining.
+    """
+    killer = None
+    try:
+        killer = get_prodev_connection()
+        cur = killer.cursor()
+        cur.execute("KILL QUERY %s", (conn.connection_id,))
+        cur.close()
+    except Exception:
+        pass
+    finally:
+        try:
+            if killer:
+                killer.close()
+        except Exception:
+            pass
+
+
+def create_table(connection: ProdevConnection) -> None:
     """
     Create the user_data table if it does not exist.
 
@@ -95,22 +204,36 @@ def create_table(connection: mysql.connector.connection_cext.CMySQLConnection) -
       - user_id VARCHAR(36) PRIMARY KEY (UUID)
       - name VARCHAR(100) NOT NULL
       - email VARCHAR(100) NOT NULL UNIQUE
-      - age DECIMAL(5,0) NOT NULL
+      - age INT UNSIGNED NOT NULL (indexed, for age filters/aggregates;
+        INT so the driver returns Python ints rather than Decimal)
+
+    A table created before `age` became INT (DECIMAL(5,0)) is migrated in place.
     """
     create_table_sql = f"""
     CREATE TABLE IF NOT EXISTS `{TABLE_NAME}` (
         user_id VARCHAR(36) NOT NULL PRIMARY KEY,
         name VARCHAR(100) NOT NULL,
         email VARCHAR(100) NOT NULL,
-        age DECIMAL(5,0) NOT NULL,
+        age INT UNSIGNED NOT NULL,
         UNIQUE KEY uq_email (email),
-        INDEX idx_user_id (user_id)
+        INDEX idx_user_id (user_id),
+        INDEX idx_age (age)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
     """
     cursor = None
     try:
         cursor = connection.cursor()
         cursor.execute(create_table_sql)
+        cursor.execute(
+            "SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s "
+            "AND COLUMN_NAME = 'age' AND DATA_TYPE <> 'int';",
+            (TABLE_NAME,),
+        )
+        (needs_migration,) = cursor.fetchone()
+        if needs_migration:
+            cursor.execute(f"ALTER TABLE `{TABLE_NAME}` MODIFY age INT UNSIGNED NOT NULL;")
+            print(f"✅ Migrated `{TABLE_NAME}`.age to INT UNSIGNED")
         connection.commit()
         print(f"✅ Table `{TABLE_NAME}` created successfully (or already exists)")
     except Error as e:
@@ -120,54 +243,201 @@ def create_table(connection: mysql.connector.connection_cext.CMySQLConnection) -
             cursor.close()
 
 
-def insert_data(connection: mysql.connector.connection_cext.CMySQLConnection, data: str) -> None:
+def _new_user_ids(n: int) -> List[str]:
+    """
+    Return `n` random (version 4) UUID strings, drawing all the random bytes
+    with a single os.urandom() call instead of one per uuid.uuid4().
+    """
+    raw = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+@lru_cache(maxsize=4)
+def _insert_sql(n: int) -> str:
+    """
+    Return the multi-row INSERT IGNORE statement for `n` rows.
+
+    Cached so every full batch passes the very same string, letting a
+    prepared cursor reuse its server-side statement instead of re-preparing.
+    """
+    return _SQL_INSERT_USERS_PREFIX + ", ".join(["(%s, %s, %s, %s)"] * n) + ";"
+
+
+def _insert_batch(cursor, rows) -> int:
+    """
+    Insert `rows` ((name, email, age) tuples) with one multi-row INSERT IGNORE
+    statement, assigning each a fresh UUID user_id, and return the number of
+    rows actually inserted.
+
+    The VALUES list is built explicitly because cursor.executemany() only
+    rewrites plain `INSERT INTO` statements into a multi-row insert and
+    would fall back to one round trip per row for `INSERT IGNORE`.
+    """
+    cursor.execute(
+        _insert_sql(len(rows)),
+        [value for user_id, row in zip(_new_user_ids(len(rows)), rows) for value in (user_id, *row)],
+    )
+    # duplicates are skipped by INSERT IGNORE; rowcount counts new rows only
+    return cursor.rowcount
+
+
+def _load_data_compatible(data: str) -> bool:
+    """
+    Return True if CSV `data` can go through LOAD DATA as-is.
+
+    The statement maps columns by position and does not honour quoting, so
+    the header must be exactly name,email,age and no line may contain an
+    extra (quoted) comma that would shift the fields.
+    """
+    with open(data, newline="", encoding="utf-8") as f:
+        header = [h.strip() for h in next(csv.reader(f, skipinitialspace=True), [])]
+        if header != ["name", "email", "age"]:
+            return False
+        return all(line.count(",") == 2 for line in f if line.strip())
+
+
+def _connect_local_infile(data: str) -> MySQLConnectionAbstract:
+    """
+    Open a dedicated ALX_prodev connection that may only send files from the
+    directory holding `data` (LOCAL INFILE is never enabled on pooled connections).
+    """
+    return mysql.connector.connect(
+        host=MYSQL_HOST,
+        user=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        port=MYSQL_PORT,
+        database=DB_NAME,
+        autocommit=False,
+        allow_local_infile=False,
+        allow_local_infile_in_path=os.path.dirname(os.path.abspath(data)),
+    )
+
+
+def _load_data_infile(data: str) -> int:
+    """
+    Bulk-load CSV file `data` with a single LOAD DATA LOCAL INFILE statement
+    on a dedicated connection, in its own transaction, and return the number
+    of rows inserted.
+
+    The server parses the file; fields are trimmed of padding and quotes,
+    user_id comes from UUID(), and duplicate emails are skipped (IGNORE).
+    LOAD DATA cannot skip rows, so rows loaded without an email are deleted
+    again before the commit, matching the row-insert path.
+    """
+    connection = _connect_local_infile(data)
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("START TRANSACTION;")
+            cursor.execute(_SQL_LOAD_DATA, (os.path.abspath(data),))
+            inserted = cursor.rowcount
+            cursor.execute(_SQL_DELETE_NO_EMAIL)
+            inserted -= cursor.rowcount
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+    finally:
+        connection.close()
+    return inserted
+
+
+def _insert_csv_rows(cursor, data: str) -> int:
+    """
+    Parse CSV file `data` in Python and insert it in batches of
+    INSERT_BATCH_SIZE; return the number of rows inserted.
+    """
+    required_fields = {"name", "email", "age"}
+    with open(data, newline="", encoding="utf-8") as f:
+        # skipinitialspace + strip() cope with the padded `"name"   , "email"` layout
+        reader = csv.reader(f, skipinitialspace=True)
+        header = [h.strip() for h in next(reader, [])]
+        if not required_fields.issubset(header):
+            raise ValueError(f"[insert_data] CSV missing required headers: {required_fields}")
+        # resolve column positions once instead of a dict lookup per field per row
+        i_name, i_email, i_age = header.index("name"), header.index("email"), header.index("age")
+        min_len = max(i_name, i_email, i_age) + 1
+
+        inserted = 0
+        buf = []
+        for row in reader:
+            if len(row) < min_len:
+                # skip short/blank lines
+                continue
+            name = row[i_name].strip()
+            email = row[i_email].strip()
+            age_raw = row[i_age].strip()
+
+            if not email:
+                # skip rows without email
+                continue
+
+            # Convert age to an integer; fallback to 0 if invalid
+            try:
+                age_val = int(float(age_raw))
+            except Exception:
+                age_val = 0
+
+            buf.append((name, email, age_val))
+            if len(buf) >= INSERT_BATCH_SIZE:
+                inserted += _insert_batch(cursor, buf)
+                buf.clear()
+
+        if buf:
+            inserted += _insert_batch(cursor, buf)
+    return inserted
+
+
+def insert_data(connection: ProdevConnection, data: str,
+                use_load_data: bool = USE_LOAD_DATA) -> None:
     """
     Insert rows from local CSV file `data` into the user_data table.
     - `data` should be a path to the CSV (e.g., 'user_data.csv').
     - CSV must have headers: name,email,age
-    - Skips rows with duplicate email (UNIQUE constraint prevents duplicates).
+    - Skips rows without an email, and rows with a duplicate email
+      (IGNORE + UNIQUE constraint).
+    - With `use_load_data`, a CSV whose columns are exactly name,email,age
+      (no quoted commas) is loaded server-side with LOAD DATA LOCAL INFILE on
+      a dedicated connection. Otherwise, or if that fails (e.g. local_infile
+      disabled), rows are parsed in Python and sent over `connection` in
+      batches of INSERT_BATCH_SIZE.
+    - Either way the load runs in one explicit transaction, committed once at
+      the end (rolled back on error).
     """
     if not os.path.exists(data):
         raise FileNotFoundError(f"[insert_data] CSV file not found: {data}")
 
-    required_fields = {"name", "email", "age"}
     cursor = None
     try:
-        with open(data, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            if not required_fields.issubset(set(reader.fieldnames or [])):
-                raise ValueError(f"[insert_data] CSV missing required headers: {required_fields}")
-
-            cursor = connection.cursor()
-            inserted = 0
-            for row in reader:
-                name = (row.get("name") or "").strip()
-                email = (row.get("email") or "").strip()
-                age_raw = (row.get("age") or "").strip()
-
-                if not email:
-                    # skip rows without email
-                    continue
-
-                # Convert age to integer-like decimal; fallback to 0 if invalid
+        inserted = None
+        if use_load_data:
+            if _load_data_compatible(data):
                 try:
-                    age_val = int(float(age_raw))
-                except Exception:
-                    age_val = 0
+                    inserted = _load_data_infile(data)
+                except Error as e:
+                    print(f"[insert_data] LOAD DATA LOCAL INFILE unavailable ({e}); using row inserts")
+            else:
+                print("[insert_data] CSV layout is not name,email,age; using row inserts")
 
-                user_id = str(uuid.uuid4())
+        if inserted is None:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("START TRANSACTION;")
+                # prepared cursor: the batch INSERT is parsed once and re-executed per batch
+                insert_cursor = connection.cursor(prepared=True)
                 try:
-                    cursor.execute(
-                        f"INSERT INTO `{TABLE_NAME}` (user_id, name, email, age) VALUES (%s, %s, %s, %s);",
-                        (user_id, name, email, age_val),
-                    )
-                    inserted += 1
-                except mysql.connector.IntegrityError:
-                    # Duplicate email or other integrity issue — skip
-                    continue
-
-            connection.commit()
-            print(f"✅ Inserted {inserted} new rows from {data}")
+                    inserted = _insert_csv_rows(insert_cursor, data)
+                finally:
+                    insert_cursor.close()
+
+                # single commit for the whole load
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+        print(f"✅ Inserted {inserted} new rows from {data}")
     except Error as e:
         print(f"[insert_data] MySQL error: {e}")
     except Exception as e:
@@ -177,7 +447,7 @@ def insert_data(connection: mysql.connector.connection_cext.CMySQLConnection, da
             cursor.close()
 
 
-def stream_user_data(connection: mysql.connector.connection_cext.CMySQLConnection) -> Iterator[Tuple[str, str, str, int]]:
+def stream_user_data(connection: ProdevConnection) -> Iterator[Tuple[str, str, str, int]]:
     """
     Generator that yields one row at a time from user_data.
     Keep the connection open while iterating.
@@ -185,7 +455,7 @@ def stream_user_data(connection: mysql.connector.connection_cext.CMySQLConnectio
     """
     cursor = connection.cursor()
     try:
-        cursor.execute(f"SELECT user_id, name, email, age FROM `{TABLE_NAME}`;")
+        cursor.execute(SQL_SELECT_USERS)
         for row in cursor:
             yield row
     except Error as e:
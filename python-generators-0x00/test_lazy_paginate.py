@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+test_lazy_paginate.py
+
+Unit tests for the background prefetch in 2-lazy_paginate.lazy_pagination().
+The database is replaced by stubs, so no MySQL server (or driver) is needed:
+
+    python -m unittest test_lazy_paginate
+"""
+
+import importlib
+import os
+import sys
+import threading
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+class _FakeCursor:
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def cursor(self, **kwargs):
+        return _FakeCursor()
+
+    def close(self):
+        self.closed.set()
+
+
+def _page(start, size):
+    return [{"user_id": f"{i:04d}"} for i in range(start, start + size)]
+
+
+class LazyPaginationTest(unittest.TestCase):
+    def setUp(self):
+        self.connection = _FakeConnection()
+        fake_seed = types.ModuleType("seed")
+        fake_seed.DB_NAME = "ALX_prodev"
+        fake_seed.connect_to_prodev = lambda: self.connection
+        with mock.patch.dict(sys.modules, {"seed": fake_seed}):
+            sys.modules.pop("2-lazy_paginate", None)
+            self.mod = importlib.import_module("2-lazy_paginate")
+        self.addCleanup(sys.modules.pop, "2-lazy_paginate", None)
+
+    def test_short_last_page_ends_walk(self):
+        pages = [_page(0, 2), _page(2, 2), _page(4, 1)]
+        calls = []
+
+        def fake_page(page_size, last_user_id, cursor):
+            calls.append(last_user_id)
+            return pages[len(calls) - 1]
+
+        with mock.patch.object(self.mod, "paginate_users_after", fake_page):
+            result = list(self.mod.lazy_pagination(2))
+
+        self.assertEqual(result, pages)
+        self.assertEqual(calls, ["", "0001", "0003"])
+        self.assertTrue(self.connection.closed.is_set())
+
+    def test_zero_page_size_yields_nothing(self):
+        with mock.patch.object(self.mod, "paginate_users_after", lambda *args: []):
+            self.assertEqual(list(self.mod.lazy_pagination(0)), [])
+
+    def test_producer_error_is_reraised(self):
+        def fake_page(page_size, last_user_id, cursor):
+            raise RuntimeError("boom")
+
+        with mock.patch.object(self.mod, "paginate_users_after", fake_page):
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                list(self.mod.lazy_pagination(2))
+        self.assertTrue(self.connection.closed.is_set())
+
+    def test_close_stops_and_joins_producer(self):
+        producers = []
+
+        def fake_page(page_size, last_user_id, cursor):
+            # endless full pages: only closing the generator can stop the walk
+            producers.append(threading.current_thread())
+            start = int(last_user_id) + 1 if last_user_id else 0
+            return _page(start, page_size)
+
+        with mock.patch.object(self.mod, "paginate_users_after", fake_page):
+            gen = self.mod.lazy_pagination(2)
+            self.assertEqual(next(gen), _page(0, 2))
+            gen.close()
+
+        self.assertFalse(producers[0].is_alive())
+        self.assertTrue(self.connection.closed.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()